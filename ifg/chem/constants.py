@@ -27,6 +27,29 @@ SMILES_REGEX = re.compile(r'(Br[+-]?|Cl[+-]?|[a-zA-Z][+-]?|[=#]|[0-9]{1}|[()])')
 AMINO_ACID_REGEX = re.compile(r'[nN]H[23]?\+')
 """Regular Expression that matches an amino acid"""
 
+##### Symbol Classification Codes #####
+ATOM_TOKEN = 0
+"""Classification code for an atom symbol"""
+
+BOND_TOKEN = 1
+"""Classification code for a bond symbol"""
+
+DIGIT_TOKEN = 2
+"""Classification code for a digit symbol"""
+
+PARENTH_TOKEN = 3
+"""Classification code for a parenthetical symbol"""
+
+##### Symbol Classification Sets #####
+BOND_SYMBOLS = frozenset('=#')
+"""Set of bond symbols, mirroring BOND_REGEX for O(1) membership checks"""
+
+DIGIT_SYMBOLS = frozenset('0123456789')
+"""Set of digit symbols, mirroring DIGIT_REGEX for O(1) membership checks"""
+
+PARENTH_SYMBOLS = frozenset('()')
+"""Set of parenthetical symbols, mirroring PARENTH_REGEX for O(1) membership checks"""
+
 ##### Required Valence Electrons Per-Atomic Orbital To Fulfill Electron Configuration Counts #####
 REQUIRED_VALENCE_COUNTS: "dict[str, int]" = {
     'C': 4,
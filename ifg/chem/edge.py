@@ -21,13 +21,22 @@ class Edge():
         index: int
             The unique integer index identifier for a particular edge in a molecular graph
     
-        Returns 
+        Returns
         -------
         Edge
             The edge object representative of a bond in a molecular graph
     """
 
-    def __init__(self, 
+    __slots__ = (
+        'index',
+        'atoms',
+        'indices',
+        'bond_type',
+        'symbols',
+    )
+    """Fixed attribute layout to avoid a per-edge __dict__, since an edge exists for every bond of every molecule and functional group graph"""
+
+    def __init__(self,
         vertices: "list[Vertex]",
         bond_type: Literal["", "=", "#"], 
         index: int
@@ -39,17 +48,17 @@ class Edge():
         """The index identifier of the edge"""
 
         ##### Vertex Identifiers #####
-        self.atoms: "list[Vertex]" = vertices
+        self.atoms: "tuple[Vertex, Vertex]" = (vertices[0], vertices[1])
         """The two vertex objects involved in the edge connection"""
 
-        self.indices: list[int] = list(int(vertex.index) for vertex in vertices)
+        self.indices: "tuple[int, int]" = (vertices[0].index, vertices[1].index)
         """The two vertex indices involved in the edge connection"""
 
         ##### Structural Edge Identifiers #####
         self.bond_type: Literal["", "=", "#"] = bond_type
         """The type of bond between the two atomic vertices"""
 
-        self.symbols: list[str] = list(str(vertex.symbol) for vertex in vertices)
+        self.symbols: "tuple[str, str]" = (vertices[0].symbol, vertices[1].symbol)
         """The two symbols of the vertex objects involved in the edge connection"""
 
 
@@ -95,4 +104,4 @@ class Edge():
         Vertex
             The vertex object of the other vertex involved in the edge
         """
-        return [vertex for vertex in self.atoms if vertex.index != vertex_index][0]
\ No newline at end of file
+        return self.atoms[1] if self.atoms[0].index == vertex_index else self.atoms[0]
\ No newline at end of file
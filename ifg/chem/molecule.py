@@ -5,6 +5,7 @@ from collections import (
     Counter, 
     defaultdict
 )
+from functools import lru_cache
 import itertools
 import os
 from typing import Literal
@@ -13,17 +14,38 @@ from .vertex import Vertex
 from .edge import Edge
 from .constants import (
     AMINO_ACID_REGEX,
-    ATOM_REGEX,
-    BOND_REGEX,
-    CHARGE_REGEX,
-    DIGIT_REGEX,
+    ATOM_TOKEN,
+    BOND_SYMBOLS,
+    BOND_TOKEN,
+    DIGIT_SYMBOLS,
+    DIGIT_TOKEN,
     ELECTRON_BOND_COUNTS,
-    PARENTH_REGEX,
+    PARENTH_SYMBOLS,
+    PARENTH_TOKEN,
     REQUIRED_VALENCE_COUNTS,
     SMILES_REGEX,
 )
 
 
+@lru_cache(maxsize=None)
+def loadFunctionalGroupTemplates() -> "tuple[tuple[str, str, 'Molecule'], ...]":
+    """Loads the identifiable functional group smiles codes and their graph templates from the functional group smiles codes CSV file.
+
+        Parsed once per process and cached, since the templates are read-only during the DFS algorithm
+        and re-building them for every molecule re-parsed the entire CSV file of functional groups.
+
+        Returns
+        -------
+        tuple[tuple[str, str, Molecule], ...]
+            A tuple of (fg_smiles, fg_name, fg template graph) per identifiable functional group
+    """
+    with open(os.path.dirname(__file__) + "/data/functional_group_smiles_codes.csv") as functional_group_smiles_codes_csv_file:
+        return tuple(
+            (fg_smiles, fg_name, Molecule(fg_smiles, fg_name, "fg"))
+            for (fg_smiles, fg_name) in csv.reader(functional_group_smiles_codes_csv_file, delimiter=",", skipinitialspace=True)
+        )
+
+
 class Molecule():
     """ A python class for the SMILES.
 
@@ -65,8 +87,17 @@ class Molecule():
         self.smiles: list[str] = SMILES_REGEX.findall(smiles)
         """The list of all smiles code symbols, with charges attached to atoms as needed, according to the SMILES_REGEX capture groups"""
 
-        self.atoms: list[str] = ATOM_REGEX.findall(smiles)
-        """The list of all smiles code atoms, inclusive of charges, according to the ATOM_REGEX capture groups"""
+        self.token_kinds: list[int] = [
+            BOND_TOKEN if symbol in BOND_SYMBOLS
+            else DIGIT_TOKEN if symbol in DIGIT_SYMBOLS
+            else PARENTH_TOKEN if symbol in PARENTH_SYMBOLS
+            else ATOM_TOKEN
+            for symbol in self.smiles
+        ]
+        """The classification code of each smiles code symbol, computed once and shared by every graph and ring pass"""
+
+        self.atoms: list[str] = [symbol for (symbol, kind) in zip(self.smiles, self.token_kinds) if kind == ATOM_TOKEN]
+        """The list of all smiles code atoms, inclusive of charges, taken from the classified symbol stream"""
 
         self.name: str = name
         """The name identifier for the smiles code"""
@@ -106,18 +137,11 @@ class Molecule():
         self.total_ring_atom_count: int = len(self.ring_atoms)
         """The total number of atoms apart of rings in the molecule"""
 
-        self.total_aromatic_atoms: int = len([symbol for symbol in self.atoms if symbol.islower()])
-        """The total number of aromatic atoms in the molecule"""
-
         self.total_non_aromatic_atoms: int = self.total_ring_atom_count-self.total_aromatic_atoms
         """The total number of non aromatic atoms in the molecule"""
     
-        ##### Atom Counts #####
-        self.atom_freq: dict[str, int] = Counter([v.symbol for v in self.vertices])
-        """The frequency of each atom in the molecule"""
-    
         ##### Miscellaneous Molecular Data #####
-        self.amino_acid: bool = len(AMINO_ACID_REGEX.findall(smiles)) != 0 
+        self.amino_acid: bool = AMINO_ACID_REGEX.search(smiles) is not None
         """The assertion of a present amino acid in the molecule"""
 
         ##### Functional Groups #####
@@ -162,30 +186,49 @@ class Molecule():
         vertices: list[Vertex] = []
         vertex: Vertex = Vertex()
         charge: str = ""
+        total_aromatic_atoms: int = 0
+        atom_freq: "Counter[str]" = Counter()
 
         ##### Atom Symbols Loop #####
         for index, symbol in enumerate(self.atoms):
 
             ##### Charge Symbol Case #####
-            if CHARGE_REGEX.search(symbol):
-                charge = CHARGE_REGEX.search(symbol).group()               # type: ignore
-                symbol = ''.join([char for char in symbol if charge != char])
+            # a charge always trails its atom symbol in the SMILES_REGEX capture groups
+            if symbol[-1] in '+-':
+                charge = symbol[-1]
+                symbol = symbol[:-1]
 
             ##### Vertex Object Construction #####
+            upper_symbol = symbol.upper()
             vertex = Vertex(
-                index=index, 
-                symbol=symbol.upper() + charge, 
-                is_aromatic=symbol.islower(), 
-                valence_electrons_required=REQUIRED_VALENCE_COUNTS[symbol.upper()],
+                index=index,
+                symbol=upper_symbol + charge,
+                is_aromatic=symbol.islower(),
+                valence_electrons_required=REQUIRED_VALENCE_COUNTS[upper_symbol],
                 charge=charge
             )
 
+            ##### Aromatic Atom Tally #####
+            if vertex.ring_type == "aromatic":
+                total_aromatic_atoms+=1
+
+            ##### Atom Frequency Tally #####
+            atom_freq[vertex.symbol]+=1
+
             ##### Reset Charge #####
             charge = ""
 
             ##### Append Vertex Object #####
             vertices.append(vertex)
 
+        ##### Aromatic Atom Count #####
+        self.total_aromatic_atoms: int = total_aromatic_atoms
+        """The total number of aromatic atoms in the molecule"""
+
+        ##### Atom Counts #####
+        self.atom_freq: dict[str, int] = atom_freq
+        """The frequency of each atom in the molecule"""
+
         ##### Return vertices #####
         return vertices
             
@@ -223,14 +266,15 @@ class Molecule():
         parenth_start_atom_stack: list[int] = []
         bond: Literal["", "=", "#"] = ""
         edges: "list[Edge]" = []
+        vertices = self.vertices
         
         ##### Algorithm Implementation #####
-        for i,symbol in enumerate(self.smiles[1:]):
+        for i,(symbol, kind) in enumerate(itertools.islice(zip(self.smiles, self.token_kinds), 1, None), start=1):
 
             ##### Atom Symbol Case #####
-            if ATOM_REGEX.match(symbol):
+            if kind == ATOM_TOKEN:
                 atom_index+=1
-                edge_atoms = [self.vertices[match_index], self.vertices[atom_index]]
+                edge_atoms = [vertices[match_index], vertices[atom_index]]
                 new_edge = Edge(edge_atoms, bond, edge_index)
                 edge_index+=1
                 edges.append(new_edge)
@@ -238,14 +282,14 @@ class Molecule():
                 bond = ""
 
             ##### Bond Symbol Case #####
-            if BOND_REGEX.match(symbol):
+            if kind == BOND_TOKEN:
                 bond = symbol               # type: ignore
 
             ##### Digit Symbol Case #####
-            if DIGIT_REGEX.match(symbol):
+            if kind == DIGIT_TOKEN:
                 if symbol in open_ring_table:
                     ring_atom_index = open_ring_table.pop(symbol)
-                    edge_atoms = [self.vertices[ring_atom_index], self.vertices[atom_index]]
+                    edge_atoms = [vertices[ring_atom_index], vertices[atom_index]]
                     new_edge = Edge(edge_atoms, "", edge_index)
                     edge_index+=1
                     edges.append(new_edge)
@@ -253,10 +297,10 @@ class Molecule():
                     open_ring_table[symbol] = atom_index 
 
             ##### Parenthesis Symbol Case #####
-            if PARENTH_REGEX.match(symbol):
-                if symbol == '(':    
-                    # double parenthetical groups [i.e. C(C)(C)] will re-append the match index 
-                    if self.smiles[1:][i-1] == ')':
+            if kind == PARENTH_TOKEN:
+                if symbol == '(':
+                    # double parenthetical groups [i.e. C(C)(C)] will re-append the match index
+                    if self.smiles[i-1] == ')':
                         parenth_start_atom_stack.append(match_index)
                     else:
                         parenth_start_atom_stack.append(atom_index)
@@ -270,6 +314,14 @@ class Molecule():
         assert not bond
 
 
+        ##### Vertex Incident Edge Adjacency #####
+        self.vertex_edges: "dict[int, list[Edge]]" = {vertex.index: [] for vertex in self.vertices}
+        """The list of incident edges per vertex index of the molecular graph"""
+        for edge in edges:
+            for vertex_index in edge.indices:
+                self.vertex_edges[vertex_index].append(edge)
+
+
         ##### Set Vertex Degrees #####
         for vertex in self.vertices:
 
@@ -281,7 +333,7 @@ class Molecule():
                 continue
 
             ##### Core Vertex Degree #####
-            total_edges = [edge for edge in edges if vertex.index in edge.indices]
+            total_edges = self.vertex_edges[vertex.index]
             explicit_valence_electrons = sum([ELECTRON_BOND_COUNTS[edge.bond_type] for edge in total_edges])        
             implicit_valence_electrons = vertex.valence_electrons_required - explicit_valence_electrons            # number of hydrogens
             vertex.explicit_degree = len(total_edges)
@@ -315,12 +367,16 @@ class Molecule():
             | ``atom_index``              (int):                  an index counter for each unique atomic symbol (synonomous with vertex index counter)
             | ``ring_stack``              (list[int]):            a stack of ``ring_index`` for the order of :ref:`open-rings-ref` (``ring_stack[-1]`` is the most recently opened ring)
             | ``ring_set``                (dict[int, list[int]]): a dictionary of key ``ring_index`` to value set of atomic indices
-            | ``ring_p_groups``           (set[int]):             a set of :ref:`Open Ring <open-rings-ref>` parenthetical group indices
+            | ``ring_p_groups``           (Counter[int]):         a counter of how many :ref:`Open Rings <open-rings-ref>` reference each parenthetical group index
             | ``ring_atom_indices``       (set[int]):             the set of atom indices apart of rings (aromatic or non-aromatic)
             | ``aromatic_ring_count``     (int):                  the number of aromatic rings
             | ``non_aromatic_ring_count`` (int):                  the number of non-aromatic rings 
         """
 
+        ########## Ring-Free Fast Path ##########
+        if DIGIT_TOKEN not in self.token_kinds:
+            return (set(), 0, 0)
+
         ########## Parenthetical Groups Preparation ##########
 
         ##### Preparation Variables #####
@@ -331,10 +387,10 @@ class Molecule():
         ring_info: dict[int, list[int]] = {}
 
         ##### Preparation Implementation #####
-        for symbol in self.smiles[1:]:
+        for (symbol, kind) in itertools.islice(zip(self.smiles, self.token_kinds), 1, None):
 
             ##### Digit Symbol Case #####
-            if DIGIT_REGEX.match(symbol):
+            if kind == DIGIT_TOKEN:
 
                 if symbol in open_ring_table:
                     open_ring_table.pop(symbol)
@@ -345,7 +401,7 @@ class Molecule():
                     ring_index+=1
 
             ##### Parenthesis Symbol Case #####
-            if PARENTH_REGEX.match(symbol):
+            if kind == PARENTH_TOKEN:
 
                 if symbol == '(':
                     p_group_counter+=1
@@ -354,7 +410,7 @@ class Molecule():
                         ring_info[ring_idx].append(p_group_counter)
 
                 else:
-                    closing_p_group = parenth_group_stack.pop(-1)
+                    closing_p_group = parenth_group_stack.pop()
                     for ring_idx in open_ring_table.values():
                         ring_info[ring_idx] = [p_group for p_group in ring_info[ring_idx] if p_group != closing_p_group]
 
@@ -362,9 +418,6 @@ class Molecule():
         assert not open_ring_table
         assert parenth_group_stack == [0]
 
-        ##### Preparation Results #####
-        # print(ring_info)
-
         ########## Algorithm Implementation ##########
 
         ##### Algorithm Variables #####
@@ -373,14 +426,15 @@ class Molecule():
         atom_index: int = 0
         ring_stack: list[int] = []
         ring_set: dict[int, list[int]] = {}
-        ring_p_groups: set[int] = set()
+        ring_p_groups: "Counter[int]" = Counter()
         ring_atom_indices: set[int] = set()
+        vertices = self.vertices
 
         ##### Algorithm Implementation #####
-        for symbol in self.smiles[1:]:
+        for (symbol, kind) in itertools.islice(zip(self.smiles, self.token_kinds), 1, None):
 
             ##### Atom Symbol Case #####
-            if ATOM_REGEX.match(symbol):
+            if kind == ATOM_TOKEN:
                 atom_index+=1
 
                 if open_ring_table:
@@ -392,7 +446,7 @@ class Molecule():
                         ring_set[ring_stack[-1]].append(atom_index)
 
             ##### Digit Symbol Case #####
-            if DIGIT_REGEX.match(symbol):
+            if kind == DIGIT_TOKEN:
 
                 if symbol in open_ring_table:
 
@@ -404,41 +458,39 @@ class Molecule():
                         if p_end_group in ring_info[prev_ring_index]:
                             ring_set[prev_ring_index].append(atom_index)
 
-                    if not atom_index in ring_set[close_ring_index]:
+                    if atom_index not in ring_set[close_ring_index]:
                         ring_set[close_ring_index].append(atom_index)
+
+                    ring_stack.remove(close_ring_index)
+                    for p_group in ring_info[close_ring_index]:
+                        ring_p_groups[p_group] -= 1
+                        if not ring_p_groups[p_group]:
+                            del ring_p_groups[p_group]
                 else:
                     open_ring_table[symbol] = ring_index
                     ring_set[ring_index] = [atom_index]
                     ring_atom_indices.add(atom_index)
+                    ring_stack.append(ring_index)
+                    for p_group in ring_info[ring_index]:
+                        ring_p_groups[p_group] += 1
                     ring_index+=1
-                
-                ring_stack = list(open_ring_table.values())
-                ring_p_groups = set(
-                    itertools.chain.from_iterable(
-                        [p_groups for ring_idx, p_groups in ring_info.items() if ring_idx in open_ring_table.values()]
-                    )
-                )
 
 
             ##### Parenthesis Symbol Case #####
-            if PARENTH_REGEX.match(symbol):
+            if kind == PARENTH_TOKEN:
 
                 if symbol == '(':
                     p_group_counter+=1
                     parenth_group_stack.append(p_group_counter)
 
                 else:
-                    parenth_group_stack.pop(-1)
+                    parenth_group_stack.pop()
 
 
         ##### Algorithm Check #####
         assert not open_ring_table
         assert parenth_group_stack == [0]
 
-        ##### Algorithm Results #####
-        # print(ring_set)
-        # print(ring_atom_indices)
-
         ########## Algorithm Collection ##########
 
         ##### Collection Variables #####
@@ -448,15 +500,15 @@ class Molecule():
         ##### Collection 1: Ring Counts #####
         for (ring_idx, atom_indices) in ring_set.items():
 
-            if len([v for v in atom_indices if self.vertices[v].ring_type == "aromatic"]) == len(atom_indices):
+            if all(vertices[v].ring_type == "aromatic" for v in atom_indices):
                 aromatic_ring_count+=1
             else:
                 non_aromatic_ring_count+=1
 
         ##### Collection 2: Atom Ring Types #####
         for atom_index in ring_atom_indices:
-            if self.vertices[atom_index].ring_type == "non-cyclic":
-                self.vertices[atom_index].ring_type = "non-aromatic"
+            if vertices[atom_index].ring_type == "non-cyclic":
+                vertices[atom_index].ring_type = "non-aromatic"
 
         ##### Collection Check #####
         assert len(ring_info.keys()) == (aromatic_ring_count + non_aromatic_ring_count)
@@ -493,6 +545,7 @@ class Molecule():
             | ``all_fgs``                 (list[Molecule]):             a list of all functional group matches under the Molecule class type, hierarchically filtered
             | ``fg``                      (Molecule):                   a functional group graph template built from its hydrogen-suppressed SMILES code
             | ``fg_matches``              (list[dict[int,int]]):        a list of ``matched_indices`` results from the DFS algorithm 
+            | ``vertex_lookup``           (dict[tuple[str, int], list[Vertex]]): a dictionary of (symbol, total degree) to the organic molecule vertices with that symbol and degree, shared by every functional group template
             | ``like_vertex_pairs``       (dict[int, list[Vertex]]):    a dicitonary of *core* functional group vertex index to all :ref:`Like Vertex Paired <like-vertex-pair-ref>` organic molecule vertex indices
             | ``fg_vertex``               (Vertex):                     a *core* functional group vertex which will begin the DFS algorithm
             | ``fg_match``                (Molecule):                   a Molecule generated functional group match with overwritten :ref:`Like Vertex Paired <like-vertex-pair-ref>` organic moleulce vertex indices
@@ -502,25 +555,23 @@ class Molecule():
         ##### All Functional Group Matches #####
         all_fgs: list[Molecule] = []
 
-        ##### Functional Groups Smiles Codes CSV File #####
-        functional_group_smiles_codes_csv_file = open(os.path.dirname(__file__) + "/data/functional_group_smiles_codes.csv")
+        ##### Molecule Vertex List Local Binding #####
+        mol_vertices = self.vertices
 
-        ##### Functional Group Loop #####
-        for (fg_smiles, fg_name) in csv.reader(functional_group_smiles_codes_csv_file, delimiter=",", skipinitialspace=True):
+        ##### Molecule Vertex Lookup By Symbol and Degree #####
+        vertex_lookup: "dict[tuple[str, int], list[Vertex]]" = defaultdict(list)
+        for mol_vertex in mol_vertices:
+            vertex_lookup[(mol_vertex.symbol, mol_vertex.total_degree)].append(mol_vertex)
 
-            ##### Functional Group Graph Template #####
-            fg: Molecule = Molecule(fg_smiles, fg_name, "fg")
+        ##### Functional Group Loop #####
+        for (fg_smiles, fg_name, fg) in loadFunctionalGroupTemplates():
 
             ##### Functional Group Matches #####
             fg_matches: list[dict[int,int]] = []
 
             ##### Functional Group Mol Vertex Start Locations #####
             like_vertex_pairs: dict[int, list[Vertex]] = {
-                fg_vertex.index: [
-                    mol_vertex for mol_vertex in self.vertices 
-                    if mol_vertex.symbol == fg_vertex.symbol and 
-                    mol_vertex.total_degree == fg_vertex.total_degree
-                ]
+                fg_vertex.index: vertex_lookup.get((fg_vertex.symbol, fg_vertex.total_degree), [])
                 for fg_vertex in fg.vertices if fg_vertex.symbol != 'R'
             }
 
@@ -534,13 +585,13 @@ class Molecule():
                 for mol_vertex in matched_mol_vertices:
 
                     ##### Functional Group DFS Match Algorithm #####
-                    fg_matched_atoms, _, _ = self.DFS(fg, fg_vertex, mol_vertex, [], [])
+                    fg_matched_atoms, _, _ = self.DFS(fg, fg_vertex, mol_vertex, set(), set())
 
                     ##### Functional Group Match Case #####
                     if (
-                        len(fg_matched_atoms) == len([vertex for vertex in fg.vertices if vertex.symbol != 'R'])
+                        len(fg_matched_atoms) == sum(1 for vertex in fg.vertices if vertex.symbol != 'R')
                         and
-                        not set(fg_matched_atoms.values()) in [set(match.values()) for match in fg_matches]
+                        set(fg_matched_atoms.values()) not in [set(match.values()) for match in fg_matches]
                     ):
                         ##### Unique Matched Functional Group Add ##### 
                         fg_matches.append(fg_matched_atoms)
@@ -552,12 +603,12 @@ class Molecule():
                 ##### Functional Group Extraction #####
                 fg_match: Molecule = Molecule(fg_smiles, fg_name, "fg")
                 for (fg_atom_index, om_atom_index) in fg_matched_atoms.items():
-                    fg_match.vertices[fg_atom_index].index = self.vertices[om_atom_index].index
-                    fg_match.vertices[fg_atom_index].ring_type = self.vertices[om_atom_index].ring_type
+                    fg_match.vertices[fg_atom_index].index = mol_vertices[om_atom_index].index
+                    fg_match.vertices[fg_atom_index].ring_type = mol_vertices[om_atom_index].ring_type
 
                 ##### Ring Classification #####
-                aromatic_tally: int = len([fg_vertex for fg_vertex in fg_match.vertices if fg_vertex.symbol != 'R' and fg_vertex.ring_type == "aromatic"])
-                non_aromatic_tally: int = len([fg_vertex for fg_vertex in fg_match.vertices if fg_vertex.symbol != 'R' and fg_vertex.ring_type == "non-aromatic"])
+                aromatic_tally: int = sum(1 for fg_vertex in fg_match.vertices if fg_vertex.symbol != 'R' and fg_vertex.ring_type == "aromatic")
+                non_aromatic_tally: int = sum(1 for fg_vertex in fg_match.vertices if fg_vertex.symbol != 'R' and fg_vertex.ring_type == "non-aromatic")
                 if aromatic_tally != 0 or non_aromatic_tally != 0:
                     nomenclature: str = "Aromatic " if aromatic_tally >= non_aromatic_tally else "Non Aromatic "
                     fg_match.name = nomenclature + fg_match.name
@@ -589,9 +640,9 @@ class Molecule():
         fg: "Molecule", 
         fg_vertex: Vertex, 
         mol_vertex: Vertex, 
-        used_mol_edges: "list[int]", 
-        used_fg_edges: "list[int]"
-    ) -> 'tuple[dict[int, int], list[int], list[int]]':
+        used_mol_edges: "set[int]",
+        used_fg_edges: "set[int]"
+    ) -> 'tuple[dict[int, int], set[int], set[int]]':
         """Searches an organic molecule software graph for the presence of a functional group sub-graph using a recursive depth first search and backtracking algorithm.
         
             Parameters
@@ -605,22 +656,22 @@ class Molecule():
             mol_vertex : Vertex
                 The current molecular vertex 
 
-            used_mol_edges : list[int]
-                The list of molecular edge indices that have already been paired with functional group edges
+            used_mol_edges : set[int]
+                The set of molecular edge indices that have already been paired with functional group edges
 
             used_fg_edges
-                The list of functional group edge indices that have already been paired with molecular edges
+                The set of functional group edge indices that have already been paired with molecular edges
 
             Returns
             -------
             matched_path_atoms: dict[int, int]
                 A recusivly cumulative dictionary of matched vertex pairs by index in the form functional_group_index : molecular_index
             
-            matched_mol_path_edges: list[int]
-                A recursivly cumulative list of used molecular edges during a search path
+            matched_mol_path_edges: set[int]
+                A recursivly cumulative set of used molecular edges during a search path
 
-            matched_fg_path_edges: list[int]
-                A recursivly cumulative list of used functional group edges during a search path
+            matched_fg_path_edges: set[int]
+                A recursivly cumulative set of used functional group edges during a search path
 
             Notes
             -----
@@ -633,20 +684,20 @@ class Molecule():
             | ``fg_complement_vertex``    (Vertex):               an *unfulfilled* core functional group vertex 
             | ``path``                    :                       a recursive call to the DFS algorithm which searches into new vertices and accumulates backtracking data
             | ``matched_path_atoms``      (dict[int,int]):        a backtracking-cumulative version of ``matched_indices``
-            | ``matched_mol_path_edges``  (list[int]):            a backtracking-cumulative version of ``used_mol_edges``
-            | ``matched_fg_path_edges``   (list[int]):            a backtracking-cumulative version of ``used_fg_edges``
+            | ``matched_mol_path_edges``  (set[int]):             a backtracking-cumulative version of ``used_mol_edges``
+            | ``matched_fg_path_edges``   (set[int]):             a backtracking-cumulative version of ``used_fg_edges``
         """
 
+        ##### Implicit Degree Validation #####
+        if fg_vertex.implicit_degree != 0 and mol_vertex.implicit_degree < fg_vertex.implicit_degree:
+            return ({}, set(), set())
+
         ##### New Atom-Pair Backtrack Variable #####
         matched_indices = {fg_vertex.index: mol_vertex.index}
 
         ##### Edge Sets #####
-        fg_core_edges = [edge for edge in fg.edges if fg_vertex.index in edge.indices and not edge.index in used_fg_edges and not 'R' in edge.symbols]
-        om_edges = [edge for edge in self.edges if mol_vertex.index in edge.indices and not edge.index in used_mol_edges]
-
-        ##### Implicit Degree Validation #####
-        if fg_vertex.implicit_degree != 0 and mol_vertex.implicit_degree < fg_vertex.implicit_degree:
-            return ({}, [], [])
+        fg_core_edges = [edge for edge in fg.vertex_edges[fg_vertex.index] if edge.index not in used_fg_edges and 'R' not in edge.symbols]
+        om_edges = [edge for edge in self.vertex_edges[mol_vertex.index] if edge.index not in used_mol_edges]
 
         ##### Functional Group End Graph Boundary Case #####
         if not fg_core_edges:
@@ -675,7 +726,7 @@ class Molecule():
                     ):
 
                         ##### DFS Recursion #####
-                        path = self.DFS(fg, fg_complement_vertex, om_corresponding_vertex, used_mol_edges + [om_edge.index], used_fg_edges + [fg_edge.index])
+                        path = self.DFS(fg, fg_complement_vertex, om_corresponding_vertex, used_mol_edges | {om_edge.index}, used_fg_edges | {fg_edge.index})
 
                         ##### Backtrack Collection #####
                         if all(path):
@@ -688,19 +739,17 @@ class Molecule():
                                 matched_indices[matched_fg_atom] = matched_mol_atom
                             
                             ##### Molecule Edge Unpacking #####
-                            for om_edge_index in matched_mol_path_edges:
-                                used_mol_edges.append(om_edge_index)
-                            
+                            used_mol_edges.update(matched_mol_path_edges)
+
                             ##### Functional Group Edge Unpacking #####
-                            for fg_edge_index in matched_fg_path_edges:
-                                used_fg_edges.append(fg_edge_index)
+                            used_fg_edges.update(matched_fg_path_edges)
                             
                             ##### Satisfied Functional Group Edge #####
                             break
 
             ##### Unsatisfied Functional Group Edge #####
             else:
-                return ({}, [], [])
+                return ({}, set(), set())
 
         ##### All Functional Group Core Edges Satisfied #####
         return (matched_indices, used_mol_edges, used_fg_edges)
@@ -736,15 +785,19 @@ class Molecule():
         ##### Matches List Evaluation Indices #####
         eval_indices: set[int] = set()
 
+        ##### Per-Match Comparison Sets #####
+        core_edge_sets: "list[set[Edge]]" = [{edge for edge in fg.edges if 'R' not in edge.symbols} for fg in all_fgs]
+        core_vertex_sets: "list[set[int]]" = [{fg_vertex.index for fg_vertex in fg.vertices if 'R' not in fg_vertex.symbol} for fg in all_fgs]
+
         ##### Hierarchical Functional Group Identification #####
-        for i, fg in enumerate(all_fgs):
-            for j, fg_compare in enumerate(all_fgs):
+        for i in range(len(all_fgs)):
+            for j in range(len(all_fgs)):
                 if i == j:
                     continue
                 if (
-                    set([edge for edge in fg.edges if not 'R' in edge.symbols]) == set([edge for edge in fg_compare.edges if not 'R' in edge.symbols]) 
-                    and 
-                    set([fg_vertex.index for fg_vertex in fg.vertices if 'R' not in fg_vertex.symbol]) == set([fg_vertex.index for fg_vertex in fg_compare.vertices if 'R' not in fg_vertex.symbol])
+                    core_edge_sets[i] == core_edge_sets[j]
+                    and
+                    core_vertex_sets[i] == core_vertex_sets[j]
                 ):
                     eval_indices.add(i)
                     eval_indices.add(j)
@@ -767,7 +820,7 @@ class Molecule():
                     break
 
         ##### Apply Skips For Accurate Results #####
-        return [fg for i, fg in enumerate(all_fgs) if not i in skip_indices]
+        return [fg for i, fg in enumerate(all_fgs) if i not in skip_indices]
         
     def overlapFilter(self, all_fgs: "list[Molecule]") -> "list[Molecule]":
         """Identifies and filters overlapping functional group matches.
@@ -792,18 +845,19 @@ class Molecule():
         ##### Indices To-Be Skipped From Matches List #####
         skip_indices: set[int] = set()
 
+        ##### Per-Match Comparison Data #####
+        core_counts: "list[int]" = [sum(1 for fg_vertex in fg.vertices if fg_vertex.symbol != 'R') for fg in all_fgs]
+        core_vertex_sets: "list[set[int]]" = [{fg_vertex.index for fg_vertex in fg.vertices if fg_vertex.symbol != 'R'} for fg in all_fgs]
+
         ##### Overlapping Functional Group Identification and Accuracy Selection #####
-        for i, fg in enumerate(all_fgs):
-            for fg_compare in all_fgs:
-                if (
-                    len([fg_vertex for fg_vertex in fg.vertices if fg_vertex.symbol != 'R']) < 
-                    len([fg_vertex for fg_vertex in fg_compare.vertices if fg_vertex.symbol != 'R'])
-                ):
-                    if set([fg_vertex.index for fg_vertex in fg.vertices if fg_vertex.symbol != 'R']).issubset(set([fg_vertex.index for fg_vertex in fg_compare.vertices if fg_vertex.symbol != 'R'])):
+        for i in range(len(all_fgs)):
+            for j in range(len(all_fgs)):
+                if core_counts[i] < core_counts[j]:
+                    if core_vertex_sets[i].issubset(core_vertex_sets[j]):
                         skip_indices.add(i)
 
         ##### Apply Skips For Accurate Results #####
-        return [fg for i, fg in enumerate(all_fgs) if not i in skip_indices]
+        return [fg for i, fg in enumerate(all_fgs) if i not in skip_indices]
 
     def __str__(self):
         """String Representation of a Molecule"""
@@ -30,7 +30,19 @@ class Vertex():
     
     """
 
-    def __init__(self, 
+    __slots__ = (
+        'index',
+        'symbol',
+        'ring_type',
+        'implicit_degree',
+        'explicit_degree',
+        'total_degree',
+        'valence_electrons_required',
+        'charge',
+    )
+    """Fixed attribute layout to avoid a per-vertex __dict__, since a vertex exists for every atom of every molecule and functional group graph"""
+
+    def __init__(self,
         index: int = 0, 
         symbol: str = 'C', 
         is_aromatic: bool = False, 
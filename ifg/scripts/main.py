@@ -3,108 +3,272 @@
 import csv
 import logging
 import os
+import sys
 import traceback
+from functools import lru_cache
+from multiprocessing import Pool
 
+import numpy
 import pandas
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xlsxwriter
 from tqdm import tqdm
 
+import chem
 from chem.molecule import Molecule
 
 ##### Target Molecular SMILES Codes #####
 STRUCTURES_PATH = os.path.dirname(__file__) + "/smiles/smiles.csv"
 """Hydrogen-suppressed organic molecule SMILES codes file to process in this script"""
 
-##### Target Main Output Excel Sheet #####
+##### Target Main Output Parquet Files #####
+ALL_OUTPUT_PATH = os.path.dirname(__file__) + '/output/functional_groups_all.parquet'
+"""Parquet file with the overlap inclusive functional group data generated by this script"""
+
+EXACT_OUTPUT_PATH = os.path.dirname(__file__) + '/output/functional_groups_exact.parquet'
+"""Parquet file with the overlap exclusive functional group data generated by this script"""
+
+##### Target Main Output Excel Sheet (optional, --xlsx flag) #####
 MAIN_OUTPUT_PATH = os.path.dirname(__file__) + '/output/functional_groups.xlsx'
-"""Excel file generated by this script"""
-
-##### Failed Structure Logging Setup #####
-with open("main.log", mode="w", encoding="UTF-8") as file:
-    file.truncate(0)
-logging.basicConfig(format='%(message)s', filename='main.log')
-
-##### Data Variables #####
-all_data: list[dict] = []
-exact_data: list[dict] = []
-mol: Molecule
-failed_mols: list[str] = []
-
-##### Input Structure Data Load #####
-STRUCTURES_CSV_FILE = csv.reader(open(STRUCTURES_PATH, "r+", encoding="UTF-8"))
-STRUCTURES = [(smiles,refcode) for (smiles,refcode) in STRUCTURES_CSV_FILE][1:]
-
-##### Structure Bar Status #####
-with tqdm(total=len(STRUCTURES)) as bar:
-
-    ##### SMILES Structure Loop #####
-    for (smiles, refcode) in STRUCTURES:
-
-        ##### Molecule Data #####
-        try:
-            mol = Molecule(smiles, name=refcode, type='mol')
-        except BaseException as exception:
-            failed_mols.append(smiles + " " + refcode)
-            print("  ", smiles, "Failed to be processed")
-            logging.error(f"{refcode} {smiles} Failed to be processed \n {traceback.format_exc()}")
+"""Excel file generated by this script when the --xlsx flag is given"""
+
+##### Identifiable Functional Group Names #####
+FUNCTIONAL_GROUPS_PATH = os.path.dirname(chem.__file__) + "/data/functional_group_smiles_codes.csv"
+"""Functional group smiles codes file used to pre-seed the data sheet columns"""
+
+##### Functional Group Column Keys #####
+def functionalGroupKeys() -> "list[str]":
+    """Builds the fixed functional group column keys from every identifiable functional group name, inclusive of their ring-classified variants"""
+
+    ##### Functional Group Names Load #####
+    with open(FUNCTIONAL_GROUPS_PATH, encoding="UTF-8") as fg_file:
+        fg_names = [fg_name for (_, fg_name) in csv.reader(fg_file, delimiter=",", skipinitialspace=True)]
+
+    ##### Ring-Classified Functional Group Column Keys #####
+    return [
+        prefix + fg_name
+        for fg_name in fg_names
+        for prefix in ("", "Aromatic ", "Non Aromatic ")
+    ]
+
+
+##### Fixed Data Sheet Column Headers #####
+SHEET_FIXED_KEYS: "tuple[str, ...]" = ("Refcode", "SMILES", "Aromatic Rings", "Non Aromatic Rings", "Rings", "AminoAcid")
+"""Structure identity and ring data column headers shared by both output data sheets"""
+
+SHEET_FG_KEYS: "tuple[str, ...]" = tuple(sorted(functionalGroupKeys()))
+"""Ring-classified functional group column headers shared by both output data sheets, in fixed sorted order"""
+
+SHEET_HEADER_KEYS: "tuple[str, ...]" = SHEET_FIXED_KEYS + SHEET_FG_KEYS
+"""Full column headers shared by both output data sheets"""
+
+##### Data Sheet Column Widths #####
+SHEET_COLUMN_WIDTHS = numpy.fromiter((len(key)+7 for key in SHEET_HEADER_KEYS[2:]), dtype=numpy.int32)
+"""Name-derived widths for every data sheet column after Refcode and SMILES"""
+
+##### Parquet Output Schema #####
+PARQUET_SCHEMA = pa.schema(
+    [
+        ("Refcode", pa.string()),
+        ("SMILES", pa.string()),
+        ("Aromatic Rings", pa.int32()),
+        ("Non Aromatic Rings", pa.int32()),
+        ("Rings", pa.int32()),
+        ("AminoAcid", pa.bool_()),
+    ]
+    + [(key, pa.int32()) for key in SHEET_FG_KEYS]
+)
+"""Columnar schema shared by both output parquet files"""
+
+##### Cached Structure Feature Computation Function #####
+@lru_cache(maxsize=None)
+def computeFeatures(smiles: str) -> "tuple[int, int, int, bool, tuple[int, ...], tuple[int, ...]]":
+    """Computes the ring, amino acid, and fixed column order functional group count features of a smiles code, memoized so duplicated input structures are only parsed once per worker"""
+
+    ##### Molecule Data #####
+    mol = Molecule(smiles, type='mol')
+
+    ##### Fixed Column Order Feature Values #####
+    fg_keys = SHEET_FG_KEYS
+    fg_all_count = mol.functional_groups_all.get
+    fg_exact_count = mol.functional_groups_exact.get
+    return (
+        mol.aromatic_ring_count,
+        mol.non_aromatic_ring_count,
+        mol.total_ring_count,
+        mol.amino_acid,
+        tuple(fg_all_count(key, 0) for key in fg_keys),
+        tuple(fg_exact_count(key, 0) for key in fg_keys),
+    )
+
+
+##### Structure Process Worker Function #####
+def processStructure(structure: "tuple[str, str]") -> "tuple[list | None, list | None, tuple[str, str, str] | None]":
+    """Computes the features of a single smiles code and returns its two functional group data sheet rows in fixed column order, or the failure details when the structure cannot be processed"""
+
+    ##### Structure Unpacking #####
+    (smiles, refcode) = structure
+
+    ##### Cached Molecule Feature Data #####
+    try:
+        (aromatic_rings, non_aromatic_rings, rings, amino_acid, all_counts, exact_counts) = computeFeatures(smiles.strip())
+    except Exception:
+        return (None, None, (smiles, refcode, traceback.format_exc()))
+
+    ##### Fixed Column Order Functional Group Format Data #####
+    fixed_values = [refcode, smiles, aromatic_rings, non_aromatic_rings, rings, amino_acid]
+    all_row = fixed_values + list(all_counts)
+    exact_row = fixed_values + list(exact_counts)
+
+    ##### Worker Results #####
+    return (all_row, exact_row, None)
+
+
+##### Worksheet Column Widths Function #####
+def setColumnWidths(sheet, widths) -> None:
+    """Applies the fixed Refcode/SMILES widths and the precomputed widths for every remaining data sheet column"""
+    sheet.set_column(0, 0, 13)      # Refcode column width
+    sheet.set_column(1, 1, 125)     # SMILES column width
+    for i, width in enumerate(widths.tolist()):
+        sheet.set_column(i+2, i+2, int(width))
+
+
+##### Parquet Table From Preallocated Shard Arrays Function #####
+def shardTable(refcodes, smiles_codes, ring_data, amino_acids, fg_counts) -> pa.Table:
+    """Builds the parquet table of one output file for one shard from its preallocated column arrays"""
+    arrays = [
+        pa.array(refcodes, type=pa.string()),
+        pa.array(smiles_codes, type=pa.string()),
+        pa.array(ring_data[:, 0], type=pa.int32()),
+        pa.array(ring_data[:, 1], type=pa.int32()),
+        pa.array(ring_data[:, 2], type=pa.int32()),
+        pa.array(amino_acids, type=pa.bool_()),
+    ] + [pa.array(fg_counts[:, column], type=pa.int32()) for column in range(fg_counts.shape[1])]
+    return pa.Table.from_arrays(arrays, schema=PARQUET_SCHEMA)
+
+
+##### Parquet Shard Path Function #####
+def shardPath(output_path: str, shard_index: int) -> str:
+    """Builds the per-worker parquet shard path for one of the output files"""
+    return output_path.replace(".parquet", ".shard" + str(shard_index) + ".parquet")
+
+
+##### Structure Shard Worker Function #####
+def processShard(shard: "tuple[int, list[tuple[str, str]]]") -> "list[tuple[str, str, str]]":
+    """Processes one contiguous shard of the input structures into its own pair of parquet shard files, returning the failure details of every structure that could not be processed"""
+
+    ##### Shard Unpacking #####
+    (shard_index, structures) = shard
+
+    ##### Preallocated Shard Column Arrays #####
+    row_count: int = len(structures)
+    refcodes = numpy.empty(row_count, dtype=object)
+    smiles_codes = numpy.empty(row_count, dtype=object)
+    ring_data = numpy.zeros((row_count, 3), dtype=numpy.int32)
+    amino_acids = numpy.zeros(row_count, dtype=bool)
+    all_counts = numpy.zeros((row_count, len(SHEET_FG_KEYS)), dtype=numpy.int16)
+    exact_counts = numpy.zeros((row_count, len(SHEET_FG_KEYS)), dtype=numpy.int16)
+    failures: list[tuple[str, str, str]] = []
+
+    ##### Shard Structure Loop #####
+    filled: int = 0
+    for structure in structures:
+
+        ##### Failed Structure Case #####
+        (all_row, exact_row, failed) = processStructure(structure)
+        if failed is not None:
+            failures.append(failed)
             continue
 
-        ##### All Functional Group Format Data #####
-        all_data.append({
-            "Refcode": mol.name,
-            "SMILES": smiles,
-            "Aromatic Rings": mol.aromatic_ring_count,
-            "Non Aromatic Rings": mol.non_aromatic_ring_count,
-            "Rings": mol.total_ring_count,
-            "AminoAcid": "Yes" if mol.amino_acid else "No",
-            **mol.functional_groups_all,
-        })
+        ##### Structure Column Array Fills #####
+        refcodes[filled] = all_row[0]
+        smiles_codes[filled] = all_row[1]
+        ring_data[filled] = all_row[2:5]
+        amino_acids[filled] = all_row[5]
+        all_counts[filled] = all_row[6:]
+        exact_counts[filled] = exact_row[6:]
+        filled += 1
+
+    ##### Shard Parquet File Saves (failed structure rows trimmed) #####
+    pq.write_table(shardTable(refcodes[:filled], smiles_codes[:filled], ring_data[:filled], amino_acids[:filled], all_counts[:filled]), shardPath(ALL_OUTPUT_PATH, shard_index))
+    pq.write_table(shardTable(refcodes[:filled], smiles_codes[:filled], ring_data[:filled], amino_acids[:filled], exact_counts[:filled]), shardPath(EXACT_OUTPUT_PATH, shard_index))
+
+    ##### Shard Worker Results #####
+    return failures
+
 
-        ##### Exact Functional Group Format Data #####
-        exact_data.append({
-            "Refcode": mol.name,
-            "SMILES": smiles,
-            "Aromatic Rings": mol.aromatic_ring_count,
-            "Non Aromatic Rings": mol.non_aromatic_ring_count,
-            "Rings": mol.total_ring_count,
-            "AminoAcid": "Yes" if mol.amino_acid else "No",
-            **mol.functional_groups_exact,
+##### Main Script Function #####
+def main() -> None:
+    """Processes every input structure in parallel and writes the functional group data files"""
+
+    ##### Failed Structure Logging Setup #####
+    with open("main.log", mode="w", encoding="UTF-8") as file:
+        file.truncate(0)
+    logging.basicConfig(format='%(message)s', filename='main.log')
+
+    ##### Data Variables #####
+    failed_mols: list[str] = []
+
+    ##### Input Structure Data Load #####
+    STRUCTURES: "list[tuple[str, str]]" = list(pandas.read_csv(STRUCTURES_PATH, header=0, usecols=['smiles', 'refcode']).itertuples(index=False, name=None))
+
+    ##### Contiguous Structure Shards (one per worker) #####
+    shard_count: int = os.cpu_count() or 1
+    shards: "list[tuple[int, list[tuple[str, str]]]]" = [
+        (shard_index, [tuple(structure) for structure in chunk])
+        for (shard_index, chunk) in enumerate(numpy.array_split(numpy.array(STRUCTURES, dtype=object), shard_count))
+        if len(chunk)
+    ]
+
+    ##### Parallel Structure Shard Loop #####
+    with Pool(processes=shard_count) as pool:
+        for shard_failures in tqdm(pool.imap_unordered(processShard, shards), total=len(shards)):
+            for (smiles, refcode, trace) in shard_failures:
+                failed_mols.append(smiles + " " + refcode)
+                print("  ", smiles, "Failed to be processed")
+                logging.error("%s %s Failed to be processed \n %s", refcode, smiles, trace)
+
+    ##### Parquet Shard Concatenation and Cleanup #####
+    for output_path in (ALL_OUTPUT_PATH, EXACT_OUTPUT_PATH):
+        shard_paths = [shardPath(output_path, shard_index) for (shard_index, _) in shards]
+        pq.write_table(pa.concat_tables([pq.read_table(path) for path in shard_paths]), output_path)
+        for path in shard_paths:
+            os.remove(path)
+
+    ##### Optional Excel Export (slow, skipped without the --xlsx flag) #####
+    if "--xlsx" in sys.argv:
+
+        ##### Excel Workbook (constant memory, string auto-detection disabled) #####
+        workbook = xlsxwriter.Workbook(MAIN_OUTPUT_PATH, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
         })
 
-        ##### Status Bar Update #####
-        bar.update(1)                                               # Increment the progress bar once smiles finishes processing
-
-##### Pandas Dataframe #####
-df_all = pandas.DataFrame(all_data).fillna(0).set_index("Refcode")
-df_exact = pandas.DataFrame(exact_data).fillna(0).set_index("Refcode")
-
-##### Excel Exporter (xlsx file type) #####
-writer = pandas.ExcelWriter(MAIN_OUTPUT_PATH)
-
-##### All Functional Groups Data Sheet Export #####
-df_all.to_excel(writer, sheet_name="all_data", freeze_panes=(1, 1))
-all_sheet = writer.sheets["all_data"]
-all_sheet.set_column(0, 0, 13)      # Refcode column width
-all_sheet.set_column(1, 1, 125)     # SMILES column width
-df_all_columns: list[str] = [str(col) for col in df_all.columns][1:]
-for i, col in enumerate(df_all_columns):
-    all_sheet.set_column(i+2, i+2, len(col)+7)
-
-##### Exact Functional Groups Data Sheet Export #####
-df_exact.to_excel(writer, sheet_name="exact_data", freeze_panes=(1, 1))
-exact_sheet = writer.sheets["exact_data"]
-exact_sheet.set_column(0, 0, 13)      # Refcode column width
-exact_sheet.set_column(1, 1, 125)     # SMILES column width
-df_exact_columns: list[str] = [str(col) for col in df_exact.columns][1:]
-for i, col in enumerate(df_exact_columns):
-    exact_sheet.set_column(i+2, i+2, len(col)+7)
-
-##### Excel File Save #####
-writer.close()
-
-##### Structure Error Result Logging #####
-if failed_mols:
-    logging.error("##### Failed SMILES codes #####")
-else:
-    logging.error("Last execution was successfull for all structures")
-for failed_mol in failed_mols:
-    logging.error(failed_mol)
+        ##### Data Sheet Exports #####
+        for (sheet_name, parquet_path) in (("all_data", ALL_OUTPUT_PATH), ("exact_data", EXACT_OUTPUT_PATH)):
+            df = pq.read_table(parquet_path).to_pandas(self_destruct=True).set_index("Refcode")
+            sheet = workbook.add_worksheet(sheet_name)
+            sheet.freeze_panes(1, 1)
+            setColumnWidths(sheet, SHEET_COLUMN_WIDTHS)
+            sheet.write_row(0, 0, [df.index.name, *df.columns])
+            for (row_index, row) in enumerate(df.itertuples(index=True, name=None), 1):
+                sheet.write_row(row_index, 0, row)
+
+        ##### Excel File Save #####
+        workbook.close()
+
+    ##### Structure Error Result Logging #####
+    if failed_mols:
+        logging.error("##### Failed SMILES codes #####")
+    else:
+        logging.error("Last execution was successfull for all structures")
+    for failed_mol in failed_mols:
+        logging.error(failed_mol)
+
+
+##### Main Script Guard (required for multiprocessing worker imports) #####
+if __name__ == "__main__":
+    main()
@@ -9,3 +9,37 @@ def test_mol():
 def test_fg():
     """Place a test functional group to view if the output works"""
     assert Molecule("[R]C(=O)[R]", name="Ketone", type="fg")
+
+def test_ring_counts():
+    """Check the ring counters of an aromatic, a non aromatic, and a ring-free molecule"""
+    aromatic = Molecule("c1ccc2c(c1)cccc2C#Cc1ccccc1C#Cc1cccc2ccccc12", type="mol")
+    assert aromatic.aromatic_ring_count == 5
+    assert aromatic.non_aromatic_ring_count == 0
+    non_aromatic = Molecule("O=C1NC2C(N(CN2N(=O)=O)N(=O)=O)N1N(=O)=O", type="mol")
+    assert non_aromatic.aromatic_ring_count == 0
+    assert non_aromatic.non_aromatic_ring_count == 2
+    ring_free = Molecule("CC(=O)NCCNC(C)=O", type="mol")
+    assert ring_free.aromatic_ring_count == 0
+    assert ring_free.non_aromatic_ring_count == 0
+
+def test_functional_group_counts():
+    """Check the functional group counters of molecules with overlapping and hierarchical groups"""
+    amide = Molecule("CC(=O)NCCNC(C)=O", type="mol")
+    assert amide.functional_groups_all == {"Amide": 2, "Ketone": 2, "SecondaryAmine": 2}
+    assert amide.functional_groups_exact == {"Amide": 2}
+    alkyne = Molecule("c1ccc2c(c1)cccc2C#Cc1ccccc1C#Cc1cccc2ccccc12", type="mol")
+    assert alkyne.functional_groups_all == {"Alkyne": 2}
+    assert alkyne.functional_groups_exact == {"Alkyne": 2}
+    nitro = Molecule("O=C1NC2C(N(CN2N(=O)=O)N(=O)=O)N1N(=O)=O", type="mol")
+    assert nitro.functional_groups_all == {
+        "Nitro": 3,
+        "Non Aromatic Amide": 2,
+        "Non Aromatic Ketone": 1,
+        "Non Aromatic SecondaryAmine": 1,
+        "Non Aromatic TertiaryAmine": 3,
+    }
+    assert nitro.functional_groups_exact == {
+        "Nitro": 3,
+        "Non Aromatic Amide": 2,
+        "Non Aromatic TertiaryAmine": 2,
+    }